@@ -48,8 +48,15 @@ def date_formatter(iso_date):
   new_str = split_date_str[1] + "/" + split_date_str[2] + "/" + split_date_str[0]
   return new_str
 
+# splits a comma separated env var into a list of trimmed, non-empty values
+def env_list(name, default=""):
+  raw = os.getenv(name) or default
+  return [val.strip() for val in raw.split(",") if val.strip()]
+
 def grab_calendar_events(f_name, position, credentials):
-    target_email = (os.getenv('TARGET_EMAIL'))
+    # calendars to read shifts from, and the scheduler accounts allowed to publish them
+    calendar_ids = env_list('CALENDAR_IDS', "primary")
+    target_emails = [email.lower() for email in env_list('TARGET_EMAILS', os.getenv('TARGET_EMAIL') or "")]
     
     timesheetEvents = []
     # Call the Calendar API
@@ -61,24 +68,40 @@ def grab_calendar_events(f_name, position, credentials):
     first_day_next_month = datetime(now.year, (now.month + 1) % 12, 1, tzinfo=timezone.utc).isoformat()
 
     print("Getting the upcoming events")
-    events_result = (
-        calendar_service.events()
-        .list(
-            calendarId="primary",
-            timeMin=first_day_month,
-            timeMax=first_day_next_month,
-            maxResults=50,
-            singleEvents=True,
-            orderBy="startTime",
-        )
-        .execute()
-    )
-    events = events_result.get("items", [])
+    events = []
+    errors = []
+
+    def collect_events(request_id, response, exception):
+      if exception is not None:
+        errors.append(exception)
+      else:
+        events.extend(response.get("items", []))
+
+    # one HTTP batch request for every calendar, so adding a calendar doesn't add another round trip
+    batch = calendar_service.new_batch_http_request(callback=collect_events)
+    for calendar_id in calendar_ids:
+      batch.add(
+          calendar_service.events().list(
+              calendarId=calendar_id,
+              timeMin=first_day_month,
+              timeMax=first_day_next_month,
+              maxResults=50,
+              singleEvents=True,
+              orderBy="startTime",
+          )
+      )
+    batch.execute()
+    if errors:
+      raise errors[0]
+
     if not events:
       print("No upcoming events found.")
       return
     
-    # Prints the start and name of the next 50 events
+    # merge the calendars back into a single stream ordered by start time
+    events.sort(key=lambda event: event["start"].get("dateTime", event["start"].get("date")))
+    seen_dates = set()
+
     for event in events:
       # first we try to grab 'dateTime' for timed events, if that fails(we have an all day event), then we grab the 'date' field
       # the 'date' field is present for all day events according to Google Calendar api docs
@@ -87,8 +110,8 @@ def grab_calendar_events(f_name, position, credentials):
       email_sender = event["creator"].get("email").lower()
       
 
-      # only process the events that are sent from the target email
-      if email_sender == target_email:
+      # only process the events that are sent from the target emails
+      if email_sender in target_emails:
         date_regex = re.search(r'\d{4}-\d{2}-\d{2}', start)
         
         # this grabs the name, pos, and hours. i.e "Leul M. (S 8.0)"
@@ -98,7 +121,9 @@ def grab_calendar_events(f_name, position, credentials):
         location = grab_location(location_regex.group(0))
         employee_hours = grab_hours(hours_regex.group(0))
     
-        if date_regex:
+        # the same shift can be published on more than one calendar, keep only the first one for each date
+        if date_regex and date_regex.group(0) not in seen_dates:
+            seen_dates.add(date_regex.group(0))
             date = date_formatter(date_regex.group(0))
             timesheetEvent = TimesheetEvent(date, employee_hours, location, f_name, format_position(position))
             timesheetEvents.append(timesheetEvent)